@@ -8,6 +8,8 @@ use WebInsights\Storage\Storage;
 
 final class Bootstrap
 {
+    private static ?Storage $storage = null;
+
     public static function rootPath(): string
     {
         return dirname(__DIR__);
@@ -33,8 +35,12 @@ final class Bootstrap
 
     public static function storage(): Storage
     {
-        self::boot();
-        return new Storage(self::storagePath('webinsights.sqlite'));
+        if (self::$storage === null) {
+            self::boot();
+            self::$storage = new Storage(self::storagePath('webinsights.sqlite'));
+        }
+
+        return self::$storage;
     }
 
     public static function ensureDirectory(string $path): void
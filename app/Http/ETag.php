@@ -0,0 +1,38 @@
+<?php
+
+declare(strict_types=1);
+
+namespace WebInsights\Http;
+
+final class ETag
+{
+    public static function fromParts(string ...$parts): string
+    {
+        return '"' . sha1(implode('|', $parts)) . '"';
+    }
+
+    public static function matches(string $etag, string $ifNoneMatch): bool
+    {
+        $ifNoneMatch = trim($ifNoneMatch);
+        if ($ifNoneMatch === '') {
+            return false;
+        }
+
+        if ($ifNoneMatch === '*') {
+            return true;
+        }
+
+        foreach (explode(',', $ifNoneMatch) as $candidate) {
+            if (self::normalize($candidate) === self::normalize($etag)) {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    private static function normalize(string $etag): string
+    {
+        return (string) preg_replace(['#^W/#', '#-gzip"$#'], ['', '"'], trim($etag));
+    }
+}
@@ -9,6 +9,23 @@ use WebInsights\Bootstrap;
 
 final class DemoReportBuilder
 {
+    private const WARNINGS = [
+        'This report uses explicit demo data. It is not connected to Google Analytics.',
+    ];
+
+    private const LANDING_PAGE_RECOMMENDATION = [
+        'action' => 'Review the top landing pages and improve calls to action.',
+        'why' => 'The pages with most views are likely to influence a large share of user journeys.',
+        'priority' => 'high',
+        'effort' => 'medium',
+    ];
+
+    private static ?array $fixture = null;
+
+    public function __construct(private readonly ?string $fixturePath = null)
+    {
+    }
+
     public function build(string $startDate, string $endDate): array
     {
         $fixture = $this->loadFixture();
@@ -21,35 +38,34 @@ final class DemoReportBuilder
             ? round(($metrics['engagedSessions'] / $metrics['sessions']) * 100, 1)
             : 0.0;
 
-        $insights = [
-            [
-                'title' => 'Organic search is the main acquisition channel',
+        $insights = [];
+        $recommendations = [self::LANDING_PAGE_RECOMMENDATION];
+
+        $topChannel = $this->topBySessions($channels);
+        if ($topChannel !== null) {
+            $insights[] = [
+                'title' => $topChannel['name'] . ' is the main acquisition channel',
                 'severity' => 'opportunity',
-                'evidence' => 'Organic Search accounts for ' . $channels[0]['sessions'] . ' sessions in the selected period.',
+                'evidence' => $topChannel['name'] . ' accounts for ' . $topChannel['sessions'] . ' sessions in the selected period.',
                 'confidence' => 0.82,
-            ],
-            [
-                'title' => 'Mobile traffic deserves specific attention',
+            ];
+        }
+
+        $topDevice = $this->topBySessions($devices);
+        if ($topDevice !== null) {
+            $insights[] = [
+                'title' => ucfirst($topDevice['name']) . ' traffic deserves specific attention',
                 'severity' => 'info',
-                'evidence' => 'Mobile sessions represent ' . $devices[0]['sessions'] . ' sessions.',
+                'evidence' => ucfirst($topDevice['name']) . ' sessions represent ' . $topDevice['sessions'] . ' sessions.',
                 'confidence' => 0.76,
-            ],
-        ];
-
-        $recommendations = [
-            [
-                'action' => 'Review the top landing pages and improve calls to action.',
-                'why' => 'The pages with most views are likely to influence a large share of user journeys.',
-                'priority' => 'high',
-                'effort' => 'medium',
-            ],
-            [
-                'action' => 'Check mobile rendering and performance before changing acquisition strategy.',
-                'why' => 'Mobile usage is high enough to affect total engagement.',
+            ];
+            $recommendations[] = [
+                'action' => 'Check ' . $topDevice['name'] . ' rendering and performance before changing acquisition strategy.',
+                'why' => ucfirst($topDevice['name']) . ' usage is high enough to affect total engagement.',
                 'priority' => 'medium',
                 'effort' => 'medium',
-            ],
-        ];
+            ];
+        }
 
         return [
             'title' => 'Demo Web Analytics Report',
@@ -59,9 +75,7 @@ final class DemoReportBuilder
                 'end' => $endDate,
             ],
             'generatedAt' => gmdate('c'),
-            'warnings' => [
-                'This report uses explicit demo data. It is not connected to Google Analytics.',
-            ],
+            'warnings' => self::WARNINGS,
             'metrics' => [
                 'users' => $metrics['users'],
                 'sessions' => $metrics['sessions'],
@@ -76,9 +90,33 @@ final class DemoReportBuilder
         ];
     }
 
+    private function topBySessions(array $rows): ?array
+    {
+        if ($rows === []) {
+            return null;
+        }
+
+        $top = $rows[0];
+        foreach ($rows as $row) {
+            if ($row['sessions'] > $top['sessions']) {
+                $top = $row;
+            }
+        }
+
+        return $top;
+    }
+
     private function loadFixture(): array
     {
-        $path = Bootstrap::fixturePath('ga4-demo.json');
+        if ($this->fixturePath !== null) {
+            return $this->readFixture($this->fixturePath);
+        }
+
+        return self::$fixture ??= $this->readFixture(Bootstrap::fixturePath('ga4-demo.json'));
+    }
+
+    private function readFixture(string $path): array
+    {
         if (!is_file($path)) {
             throw new RuntimeException('Demo fixture not found.');
         }
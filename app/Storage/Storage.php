@@ -44,7 +44,7 @@ final class Storage
             ':source' => (string) $report['source'],
             ':period_start' => (string) $report['period']['start'],
             ':period_end' => (string) $report['period']['end'],
-            ':payload' => json_encode($report, JSON_PRETTY_PRINT | JSON_UNESCAPED_SLASHES),
+            ':payload' => json_encode($report, JSON_UNESCAPED_SLASHES | JSON_THROW_ON_ERROR),
             ':created_at' => gmdate('c'),
         ]);
 
@@ -4,11 +4,10 @@ declare(strict_types=1);
 
 require_once __DIR__ . '/../../app/autoload.php';
 
+use JsonException;
 use WebInsights\Bootstrap;
 use WebInsights\Reports\DemoReportBuilder;
 
-Bootstrap::boot();
-
 $startDate = (string) ($_POST['start_date'] ?? '');
 $endDate = (string) ($_POST['end_date'] ?? '');
 
@@ -20,6 +19,13 @@ if (!$startDate || !$endDate || $startDate > $endDate) {
 
 $builder = new DemoReportBuilder();
 $report = $builder->build($startDate, $endDate);
-$id = Bootstrap::storage()->saveReport($report);
+
+try {
+    $id = Bootstrap::storage()->saveReport($report);
+} catch (JsonException $exception) {
+    http_response_code(500);
+    echo 'Report could not be saved.';
+    exit;
+}
 
 header('Location: ../report.php?id=' . $id, true, 303);
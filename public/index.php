@@ -6,8 +6,11 @@ require_once __DIR__ . '/../app/autoload.php';
 
 use WebInsights\Bootstrap;
 
-Bootstrap::boot();
 $reports = Bootstrap::storage()->latestReports(8);
+
+$today = time();
+$defaultEndDate = date('Y-m-d', $today);
+$defaultStartDate = date('Y-m-d', strtotime('-30 days', $today));
 ?>
 <!doctype html>
 <html lang="en">
@@ -30,11 +33,11 @@ $reports = Bootstrap::storage()->latestReports(8);
             <form method="post" action="api/generate-demo-report.php" class="form-grid">
                 <label>
                     Start date
-                    <input type="date" name="start_date" value="<?= htmlspecialchars(date('Y-m-d', strtotime('-30 days')), ENT_QUOTES) ?>" required>
+                    <input type="date" name="start_date" value="<?= htmlspecialchars($defaultStartDate, ENT_QUOTES) ?>" required>
                 </label>
                 <label>
                     End date
-                    <input type="date" name="end_date" value="<?= htmlspecialchars(date('Y-m-d'), ENT_QUOTES) ?>" required>
+                    <input type="date" name="end_date" value="<?= htmlspecialchars($defaultEndDate, ENT_QUOTES) ?>" required>
                 </label>
                 <button type="submit">Generate report</button>
             </form>
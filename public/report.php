@@ -5,6 +5,7 @@ declare(strict_types=1);
 require_once __DIR__ . '/../app/autoload.php';
 
 use WebInsights\Bootstrap;
+use WebInsights\Http\ETag;
 
 $id = (int) ($_GET['id'] ?? 0);
 $report = $id > 0 ? Bootstrap::storage()->reportById($id) : null;
@@ -15,6 +16,15 @@ if (!$report) {
     exit;
 }
 
+$etag = ETag::fromParts((string) $id, (string) ($report['generatedAt'] ?? ''), (string) filemtime(__FILE__));
+header('ETag: ' . $etag);
+header('Cache-Control: private, no-cache');
+
+if (ETag::matches($etag, (string) ($_SERVER['HTTP_IF_NONE_MATCH'] ?? ''))) {
+    http_response_code(304);
+    exit;
+}
+
 function e(mixed $value): string
 {
     return htmlspecialchars((string) $value, ENT_QUOTES, 'UTF-8');
@@ -16,7 +16,9 @@ if (PHP_SAPI !== 'cli') {
 
 require_once __DIR__ . '/../app/autoload.php';
 
+use WebInsights\Http\ETag;
 use WebInsights\Reports\DemoReportBuilder;
+use WebInsights\Storage\Storage;
 
 function assert_true(bool $condition, string $message): void
 {
@@ -26,6 +28,26 @@ function assert_true(bool $condition, string $message): void
     }
 }
 
+function temp_path(string $prefix): string
+{
+    $path = tempnam(sys_get_temp_dir(), $prefix);
+    register_shutdown_function(static function () use ($path): void {
+        if (is_file($path)) {
+            unlink($path);
+        }
+    });
+
+    return $path;
+}
+
+function temp_fixture(array $data): string
+{
+    $path = temp_path('webinsights-fixture-');
+    file_put_contents($path, json_encode($data, JSON_THROW_ON_ERROR));
+
+    return $path;
+}
+
 $builder = new DemoReportBuilder();
 $report = $builder->build('2026-04-01', '2026-04-30');
 
@@ -33,5 +55,84 @@ assert_true($report['source'] === 'demo', 'Report source should be demo.');
 assert_true(isset($report['metrics']['users']), 'Report should include users metric.');
 assert_true(count($report['insights']) > 0, 'Report should include at least one insight.');
 assert_true(count($report['recommendations']) > 0, 'Report should include at least one recommendation.');
+assert_true(
+    $report['insights'][0]['title'] === 'Organic Search is the main acquisition channel',
+    'Top channel insight should name the channel with most sessions.'
+);
+
+$secondReport = $builder->build('2026-05-01', '2026-05-31');
+assert_true($secondReport['period']['start'] === '2026-05-01', 'Repeated builds should use their own period.');
+assert_true($secondReport['metrics'] === $report['metrics'], 'Repeated builds should produce the same demo metrics.');
+
+$unsortedFixture = [
+    'metrics' => ['users' => 10, 'sessions' => 20, 'views' => 30, 'engagedSessions' => 10],
+    'channels' => [
+        ['name' => 'Email', 'sessions' => 3],
+        ['name' => 'Referral', 'sessions' => 12],
+        ['name' => 'Direct', 'sessions' => 5],
+    ],
+    'pages' => [],
+    'devices' => [
+        ['name' => 'tablet', 'sessions' => 2],
+        ['name' => 'desktop', 'sessions' => 4],
+        ['name' => 'mobile', 'sessions' => 14],
+    ],
+];
+$unsortedReport = (new DemoReportBuilder(temp_fixture($unsortedFixture)))->build('2026-04-01', '2026-04-30');
+assert_true(
+    $unsortedReport['insights'][0]['title'] === 'Referral is the main acquisition channel',
+    'Top channel should be picked by sessions, not by row order.'
+);
+assert_true(
+    $unsortedReport['insights'][1]['title'] === 'Mobile traffic deserves specific attention',
+    'Top device should be picked by sessions, not by row order.'
+);
+
+$noChannelsReport = (new DemoReportBuilder(temp_fixture(['channels' => []] + $unsortedFixture)))
+    ->build('2026-04-01', '2026-04-30');
+assert_true(count($noChannelsReport['insights']) === 1, 'An empty channel breakdown should skip the channel insight.');
+assert_true(
+    $noChannelsReport['insights'][0]['title'] === 'Mobile traffic deserves specific attention',
+    'The device insight should remain when channels are empty.'
+);
+
+$desktopFixture = $unsortedFixture;
+$desktopFixture['devices'][1]['sessions'] = 40;
+$desktopReport = (new DemoReportBuilder(temp_fixture($desktopFixture)))->build('2026-04-01', '2026-04-30');
+assert_true(
+    $desktopReport['insights'][1]['title'] === 'Desktop traffic deserves specific attention',
+    'Device insight should follow the leading device.'
+);
+assert_true(
+    $desktopReport['recommendations'][1]['action'] === 'Check desktop rendering and performance before changing acquisition strategy.',
+    'Device recommendation should match the device insight.'
+);
 
 fwrite(STDOUT, "OK: demo report builder\n");
+
+$databasePath = temp_path('webinsights-test-');
+
+$storage = new Storage($databasePath);
+$id = $storage->saveReport($report);
+assert_true($id > 0, 'Saving a report should return its id.');
+
+$reopened = new Storage($databasePath);
+$stored = $reopened->reportById($id);
+assert_true($stored !== null && $stored['metrics'] === $report['metrics'], 'Stored report should round-trip its metrics.');
+assert_true(count($reopened->latestReports(10)) === 1, 'Report history should list the saved report.');
+assert_true($reopened->reportById($id + 1) === null, 'Unknown report ids should return null.');
+
+fwrite(STDOUT, "OK: report storage\n");
+
+$etag = ETag::fromParts('1', '2026-04-30T00:00:00+00:00', '1700000000');
+$hash = trim($etag, '"');
+assert_true($etag !== ETag::fromParts('1', '2026-04-30T00:00:00+00:00', '1700000001'), 'Template changes should change the ETag.');
+assert_true(ETag::matches($etag, $etag), 'Exact ETag should match.');
+assert_true(ETag::matches($etag, 'W/' . $etag), 'Weak ETag should match.');
+assert_true(ETag::matches($etag, '"' . $hash . '-gzip"'), 'Apache -gzip ETag should match.');
+assert_true(ETag::matches($etag, '"other", ' . $etag), 'ETag inside a list should match.');
+assert_true(ETag::matches($etag, '*'), 'Wildcard should match.');
+assert_true(!ETag::matches($etag, ''), 'Empty header should not match.');
+assert_true(!ETag::matches($etag, '"other"'), 'Different ETag should not match.');
+
+fwrite(STDOUT, "OK: report etag\n");